@@ -1,19 +1,25 @@
+import asyncio
+import logging
+
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from fastapi_limiter import FastAPILimiter
 import redis.asyncio as redis
 
 from src.routes import contacts, auth, users
 from src.conf.config import config
+from src.database.db import sessionmanager
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "ETag"],
 )
 app.include_router(auth.router)
 app.include_router(contacts.router, prefix="/api")
@@ -27,11 +33,15 @@ async def startup():
 
     This function creates a connection to the Redis server using the
     configuration parameters and initializes the FastAPILimiter with the
-    Redis connection.
+    Redis connection. It also starts the database connection pool monitor
+    and logs which event loop implementation serves the application.
 
     Returns:
         None
     """
+    logging.getLogger("uvicorn.error").info(
+        "Event loop: %s", type(asyncio.get_running_loop()).__module__
+    )
     r = await redis.Redis(
         host=config.redis_host,
         port=config.redis_port,
@@ -40,6 +50,18 @@ async def startup():
         decode_responses=True,
     )
     await FastAPILimiter.init(r)
+    app.state.pool_monitor = asyncio.create_task(sessionmanager.monitor_pool())
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """
+    Stop the database connection pool monitor on shutdown.
+
+    Returns:
+        None
+    """
+    app.state.pool_monitor.cancel()
 
 
 @app.get("/")
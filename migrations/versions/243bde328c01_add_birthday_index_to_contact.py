@@ -0,0 +1,33 @@
+"""add birthday index to Contact
+
+Revision ID: 243bde328c01
+Revises: 1edf0a62e157
+Create Date: 2026-10-15 10:12:41.318402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '243bde328c01'
+down_revision = '1edf0a62e157'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_contact_user_bd_month_day',
+        'contacts',
+        [
+            'user_id',
+            sa.text('EXTRACT(month FROM bd_date)'),
+            sa.text('EXTRACT(day FROM bd_date)'),
+        ],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contact_user_bd_month_day', table_name='contacts')
@@ -0,0 +1,49 @@
+"""add per-user indexes to Contact
+
+Revision ID: 9a41f3c6e8d2
+Revises: 243bde328c01
+Create Date: 2026-10-15 11:48:05.117230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a41f3c6e8d2'
+down_revision = '243bde328c01'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contact_user_id',
+            'contacts',
+            ['user_id', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_contact_user_number',
+            'contacts',
+            ['user_id', 'number'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_contact_user_number',
+            table_name='contacts',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_contact_user_id',
+            table_name='contacts',
+            postgresql_concurrently=True,
+        )
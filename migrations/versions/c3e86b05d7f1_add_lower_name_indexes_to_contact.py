@@ -0,0 +1,36 @@
+"""add lower name indexes to Contact
+
+Revision ID: c3e86b05d7f1
+Revises: 9a41f3c6e8d2
+Create Date: 2026-10-15 12:26:51.640338
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e86b05d7f1'
+down_revision = '9a41f3c6e8d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_contact_lower_name',
+        'contacts',
+        ['user_id', sa.text('lower(name)')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_contact_lower_surname',
+        'contacts',
+        ['user_id', sa.text('lower(surname)')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contact_lower_surname', table_name='contacts')
+    op.drop_index('ix_contact_lower_name', table_name='contacts')
@@ -1,6 +1,9 @@
+import asyncio
 import contextlib
+import logging
 from typing import AsyncIterator
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -8,17 +11,57 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool, QueuePool
 
 from src.conf.config import config
 
+logger = logging.getLogger("uvicorn.error")
+
 
 class Base(DeclarativeBase):
     pass
 
 
+def engine_options(url: str) -> dict:
+    """
+    Build pool and driver options for the application engine.
+
+    When the database is reached through PgBouncer in transaction mode the
+    bouncer owns the pool, so SQLAlchemy opens a connection per checkout
+    and asyncpg statement caches are disabled.
+
+    :param url: Database connection URL.
+    :return: Keyword arguments for ``create_async_engine``.
+    """
+    asyncpg = make_url(url).get_driver_name() == "asyncpg"
+    if config.pgbouncer:
+        options = {"poolclass": NullPool}
+        if asyncpg:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+            }
+        return options
+    options = {
+        "pool_size": config.sqlalchemy_pool_size,
+        "max_overflow": config.sqlalchemy_max_overflow,
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+    if asyncpg:
+        options["connect_args"] = {
+            "statement_cache_size": 1024,
+            "prepared_statement_cache_size": 512,
+        }
+    return options
+
+
 class DatabaseSessionManager:
     def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        self._engine: AsyncEngine | None = create_async_engine(
+            url, query_cache_size=1200, **engine_options(url)
+        )
         self._session_maker: async_sessionmaker | None = async_sessionmaker(
             autocommit=False, autoflush=False, expire_on_commit=False, bind=self._engine
         )
@@ -27,14 +70,30 @@ class DatabaseSessionManager:
     async def session(self) -> AsyncIterator[AsyncSession]:
         if self._session_maker is None:
             raise Exception("DatabaseSessionManager is not initialized")
-        session = self._session_maker()
-        try:
-            yield session
-        except Exception as err:
-            print(err)
-            await session.rollback()
-        finally:
-            await session.close()
+        async with self._session_maker() as session:
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def monitor_pool(self, interval: int = 60) -> None:
+        """
+        Log the connection pool status every ``interval`` seconds.
+
+        A warning is logged when the pool is about to run out of connections.
+
+        :param interval: Seconds between two checks.
+        """
+        pool = self._engine.pool
+        if not isinstance(pool, QueuePool):
+            return
+        limit = config.sqlalchemy_pool_size + config.sqlalchemy_max_overflow
+        while True:
+            await asyncio.sleep(interval)
+            logger.info(pool.status())
+            if pool.checkedout() >= limit - 2:
+                logger.warning("Connection pool is almost exhausted: %s", pool.status())
 
 
 sessionmanager = DatabaseSessionManager(config.sqlalchemy_database_url)
@@ -1,8 +1,10 @@
-from datetime import date
+from datetime import date, datetime
 
 from sqlalchemy import (
     String,
     ForeignKey,
+    Index,
+    extract,
     func,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -12,6 +14,11 @@ from src.database.db import Base
 
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contact_user_id", "user_id", "id"),
+        Index("ix_contact_user_number", "user_id", "number"),
+        Index("ix_contact_user_updated_at", "user_id", "updated_at"),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(150), nullable=False, index=True)
     surname: Mapped[str] = mapped_column(String(150), nullable=False, index=True)
@@ -21,10 +28,27 @@ class Contact(Base):
     additional_data: Mapped[str] = mapped_column(String(255))
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     user: Mapped["User"] = relationship("User", backref="todos", lazy="joined")
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(), onupdate=func.now()
+    )
+
+
+# Serves the case-insensitive search on name and surname.
+Index("ix_contact_lower_name", Contact.user_id, func.lower(Contact.name))
+Index("ix_contact_lower_surname", Contact.user_id, func.lower(Contact.surname))
+
+# Serves the birthday lookup, which filters on (month, day) of ``bd_date``.
+Index(
+    "ix_contact_user_bd_month_day",
+    Contact.user_id,
+    extract("month", Contact.bd_date),
+    extract("day", Contact.bd_date),
+).ddl_if(dialect="postgresql")
 
 
 class User(Base):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
     id: Mapped[int] = mapped_column(primary_key=True)
     username: Mapped[str] = mapped_column(String(50))
     email: Mapped[str] = mapped_column(String(250), nullable=False, unique=True)
@@ -1,56 +1,115 @@
-from datetime import datetime, timedelta
-
-from sqlalchemy import select, extract, func
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import (
+    select,
+    update,
+    delete,
+    extract,
+    func,
+    tuple_,
+    bindparam,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.database.models import Contact, User
 from src.schemas import ContactSchema
 
+# Read-only listings select plain columns and skip the ORM identity map.
+_contact_columns = (
+    Contact.id,
+    Contact.name,
+    Contact.surname,
+    Contact.email,
+    Contact.number,
+    Contact.bd_date,
+    Contact.additional_data,
+)
+
+_contact_sq = select(Contact).where(
+    Contact.id == bindparam("contact_id"),
+    Contact.user_id == bindparam("user_id"),
+)
+
+_by_field_sq = select(*_contact_columns).where(
+    Contact.user_id == bindparam("user_id"),
+    (func.lower(Contact.name) == bindparam("value"))
+    | (func.lower(Contact.surname) == bindparam("value"))
+    | (Contact.email == bindparam("email")),
+)
+
+_birthday = tuple_(extract("month", Contact.bd_date), extract("day", Contact.bd_date))
+
+
+def _set_owner(contact: Contact | None, user: User) -> Contact | None:
+    """
+    Attach the owner to a contact loaded from a RETURNING clause.
+
+    RETURNING only yields the contact's own columns, so the ``user``
+    relationship is set here instead of being lazy loaded later.
+
+    :param contact: Contact object or None.
+    :param user: User object representing the owner of the contact.
+    :return: The same contact object or None.
+    """
+    if contact:
+        set_committed_value(contact, "user", user)
+    return contact
+
 
-async def get_contacts(limit: int, offset: int, user: User, db: AsyncSession):
+async def get_contacts(limit: int, after_id: int | None, user: User, db: AsyncSession):
     """
-    Retrieve a list of contacts belonging to a specific user.
+    Retrieve a page of contacts belonging to a specific user.
 
     :param limit: Maximum number of contacts to retrieve.
-    :param offset: Number of contacts to skip before retrieving.
+    :param after_id: ID of the last contact of the previous page, or None.
     :param user: User object representing the owner of the contacts.
     :param db: AsyncSession instance for database operations.
-    :return: List of contact objects.
+    :return: List of contact rows.
     """
-    sq = select(Contact).filter_by(user=user).offset(offset).limit(limit)
+    sq = (
+        select(*_contact_columns)
+        .where(Contact.user_id == user.id)
+        .order_by(Contact.id)
+        .limit(limit)
+    )
+    if after_id:
+        sq = sq.where(Contact.id > after_id)
     contacts = await db.execute(sq)
-    return contacts.scalars().all()
+    return contacts.mappings().all()
 
 
-async def get_contact(contact_id: int, user: User, db: AsyncSession):
+async def get_contacts_state(
+    user: User, db: AsyncSession
+) -> tuple[datetime | None, int]:
     """
-    Retrieve a specific contact belonging to a user.
+    Retrieve the latest modification time and number of a user's contacts.
 
-    :param contact_id: ID of the contact to retrieve.
-    :param user: User object representing the owner of the contact.
+    :param user: User object representing the owner of the contacts.
     :param db: AsyncSession instance for database operations.
-    :return: The requested contact object or None if not found.
+    :return: Latest ``updated_at`` (None if there are no contacts) and count.
     """
-    sq = select(Contact).filter_by(id=contact_id, user=user)
-    contact = await db.execute(sq)
-    return contact.scalar_one_or_none()
+    sq = select(func.max(Contact.updated_at), func.count()).where(
+        Contact.user_id == user.id
+    )
+    result = await db.execute(sq)
+    updated_at, total = result.one()
+    return updated_at, total
 
 
-async def get_existing_contact(
-    body: ContactSchema,
-    user: User,
-    db: AsyncSession,
-):
+async def get_contact(contact_id: int, user: User, db: AsyncSession):
     """
-    Retrieve an existing contact based on email and number.
+    Retrieve a specific contact belonging to a user.
 
-    :param body: ContactSchema object containing email and number.
-    :param user: User object representing the owner of the contacts.
+    :param contact_id: ID of the contact to retrieve.
+    :param user: User object representing the owner of the contact.
     :param db: AsyncSession instance for database operations.
-    :return: The existing contact object or None if not found.
+    :return: The requested contact object or None if not found.
     """
-    sq = select(Contact).filter_by(email=body.email, number=body.number, user=user)
-    contact = await db.execute(sq)
+    contact = await db.execute(
+        _contact_sq, {"contact_id": contact_id, "user_id": user.id}
+    )
     return contact.scalar_one_or_none()
 
 
@@ -61,21 +120,27 @@ async def create_contact(body: ContactSchema, user: User, db: AsyncSession):
     :param body: ContactSchema object containing contact information.
     :param user: User object representing the owner of the contact.
     :param db: AsyncSession instance for database operations.
-    :return: The newly created contact object.
-    """
-    contact = Contact(
-        name=body.name,
-        surname=body.surname,
-        email=body.email,
-        number=body.number,
-        bd_date=body.bd_date,
-        additional_data=body.additional_data,
-        user=user,
+    :return: The newly created contact object or None if its email or number
+        is already taken.
+    """
+    sq = (
+        insert(Contact)
+        .values(
+            name=body.name,
+            surname=body.surname,
+            email=body.email,
+            number=body.number,
+            bd_date=body.bd_date,
+            additional_data=body.additional_data,
+            user_id=user.id,
+        )
+        .on_conflict_do_nothing()
+        .returning(Contact)
     )
-    db.add(contact)
+    result = await db.execute(sq)
+    contact = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(contact)
-    return contact
+    return _set_owner(contact, user)
 
 
 async def update_contact(
@@ -90,19 +155,17 @@ async def update_contact(
     :param db: AsyncSession instance for database operations.
     :return: The updated contact object or None if not found.
     """
-    sq = select(Contact).filter_by(id=contact_id, user=user)
+    sq = (
+        update(Contact)
+        .where(Contact.id == contact_id, Contact.user_id == user.id)
+        .values(**body.model_dump(exclude_unset=True))
+        .returning(Contact)
+        .execution_options(synchronize_session=False)
+    )
     result = await db.execute(sq)
     contact = result.scalar_one_or_none()
-    if contact:
-        contact.name = body.name
-        contact.surname = body.surname
-        contact.email = body.email
-        contact.number = body.number
-        contact.bd_date = body.bd_date
-        contact.additional_data = body.additional_data
-        await db.commit()
-        await db.refresh(contact)
-    return contact
+    await db.commit()
+    return _set_owner(contact, user)
 
 
 async def remove_contact(contact_id: int, user: User, db: AsyncSession):
@@ -114,13 +177,15 @@ async def remove_contact(contact_id: int, user: User, db: AsyncSession):
     :param db: AsyncSession instance for database operations.
     :return: The removed contact object or None if not found.
     """
-    sq = select(Contact).filter_by(id=contact_id, user=user)
+    sq = (
+        delete(Contact)
+        .where(Contact.id == contact_id, Contact.user_id == user.id)
+        .returning(Contact)
+    )
     result = await db.execute(sq)
     contact = result.scalar_one_or_none()
-    if contact:
-        await db.delete(contact)
-        await db.commit()
-    return contact
+    await db.commit()
+    return _set_owner(contact, user)
 
 
 async def get_by_field(contact_value: str, user: User, db: AsyncSession):
@@ -130,19 +195,17 @@ async def get_by_field(contact_value: str, user: User, db: AsyncSession):
     :param contact_value: Value to search for in name, surname, or email fields.
     :param user: User object representing the owner of the contacts.
     :param db: AsyncSession instance for database operations.
-    :return: List of contact objects matching the search value.
-    """
-    sq = (
-        select(Contact)
-        .filter_by(user=user)
-        .filter(
-            (func.lower(Contact.name) == contact_value.lower())
-            | (func.lower(Contact.surname) == contact_value.lower())
-            | (Contact.email == contact_value)
-        )
+    :return: List of contact rows matching the search value.
+    """
+    contact = await db.execute(
+        _by_field_sq,
+        {
+            "user_id": user.id,
+            "value": contact_value.lower(),
+            "email": contact_value,
+        },
     )
-    contact = await db.execute(sq)
-    return contact.scalars()
+    return contact.mappings().all()
 
 
 async def birthday_week_contacts(user: User, db: AsyncSession):
@@ -151,20 +214,17 @@ async def birthday_week_contacts(user: User, db: AsyncSession):
 
     :param user: User object representing the owner of the contacts.
     :param db: AsyncSession instance for database operations.
-    :return: List of contact objects with birthdays in the upcoming week.
+    :return: List of contact rows with birthdays in the upcoming week.
     """
-    today = datetime.today()
-    next_week = today + timedelta(days=7)
+    today = date.today()
+    week = tuple(today + timedelta(days=i) for i in range(7))
+    keys = tuple((day.month, day.day) for day in week)
 
-    sq = (
-        select(Contact)
-        .filter_by(user=user)
-        .filter(
-            extract("month", Contact.bd_date).between(today.month, next_week.month),
-            extract("day", Contact.bd_date).between(today.day, next_week.day),
-        )
+    sq = select(*_contact_columns).where(
+        Contact.user_id == user.id,
+        _birthday.in_(keys),
     )
 
     contacts = await db.execute(sq)
 
-    return contacts.scalars().all()
+    return contacts.mappings().all()
@@ -42,7 +42,6 @@ async def create_user(body: UserSchema, db: AsyncSession) -> User:
     new_user = User(**body.model_dump(), avatar=avatar)
     db.add(new_user)
     await db.commit()
-    await db.refresh(new_user)
     return new_user
 
 
@@ -1,45 +1,144 @@
+import asyncio
+from datetime import date
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends, status, Path, Query
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Depends,
+    status,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from fastapi_limiter.depends import RateLimiter
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.database.models import User
-from src.schemas import ContactResponseSchema, ContactSchema
+from src.schemas import (
+    ContactResponseSchema,
+    ContactSchema,
+    ContactShortResponseSchema,
+)
 
 from src.repository import contacts as repository_contacts
 from src.services.auth import auth_service
+from src.services.cache import response_cache
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
+_contact_list = TypeAdapter(List[ContactShortResponseSchema])
+
+
+def _render(contact) -> Response:
+    """
+    Render a contact as a JSON response.
+
+    Args:
+        contact: A contact object.
+
+    Returns:
+        Response: The rendered response.
+    """
+    content = ContactResponseSchema.model_validate(contact).model_dump_json()
+    return Response(content=content, media_type="application/json")
+
+
+def _render_list(contacts) -> Response:
+    """
+    Render a list of contacts as a JSON response.
+
+    The whole list is validated and serialized in one call to pydantic-core,
+    instead of FastAPI validating the response item by item.
+
+    Args:
+        contacts: A list of contact objects or rows.
+
+    Returns:
+        Response: The rendered response.
+    """
+    content = _contact_list.dump_json(_contact_list.validate_python(contacts))
+    return Response(content=content, media_type="application/json")
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    """
+    Answer a conditional request whose ``If-None-Match`` matches the ETag.
+
+    Args:
+        request (Request): The HTTP request object.
+        etag (str): The current ETag of the requested resource.
+
+    Returns:
+        Response | None: A 304 response, or None if the client copy is stale.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    if etag in tags or "*" in tags:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    return None
+
 
 @router.get(
     "/",
-    response_model=List[ContactResponseSchema],
+    response_model=List[ContactShortResponseSchema],
     description="No more than 10 requests per minute",
     dependencies=[Depends(RateLimiter(times=10, seconds=60))],
 )
 async def get_contacts(
+    request: Request,
     limit: int = Query(10, ge=10, le=500),
-    offset: int = Query(0, ge=0, le=200),
+    after_id: int | None = Query(None, ge=0),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(auth_service.get_current_user),
 ):
     """
-    Get a list of contacts.
+    Get a page of contacts.
+
+    The ID of the last returned contact is sent in the ``X-Next-Cursor``
+    header when the page is full; pass it as ``after_id`` to get the next page.
+    The total number of contacts is sent in the ``X-Total-Count`` header.
+    The response carries an ``ETag`` built from the latest modification time
+    and the number of contacts; a matching ``If-None-Match`` gets a 304.
+    Responses are cached per user for a short time; a cached response is
+    only served if it was built for the current ETag.
 
     Args:
+        request (Request): The HTTP request object.
         limit (int): The maximum number of contacts to retrieve.
-        offset (int): The offset for pagination.
+        after_id (int | None): The ID of the last contact of the previous page.
         db (AsyncSession): The asynchronous database session.
         user (User): The authenticated user.
 
     Returns:
-        List[ContactResponseSchema]: List of contacts.
+        List[ContactShortResponseSchema]: List of contacts.
     """
-    contacts = await repository_contacts.get_contacts(limit, offset, user, db)
-    return contacts
+    key = response_cache.key(user.id, request)
+    (updated_at, total), response = await asyncio.gather(
+        repository_contacts.get_contacts_state(user, db),
+        response_cache.get(key),
+    )
+    version = updated_at.timestamp() if updated_at else 0
+    etag = f'W/"{version}-{total}"'
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    if response is None or response.headers.get("ETag") != etag:
+        contacts = await repository_contacts.get_contacts(limit, after_id, user, db)
+        response = _render_list(contacts)
+        response.headers["ETag"] = etag
+        response.headers["X-Total-Count"] = str(total)
+        if len(contacts) == limit:
+            response.headers["X-Next-Cursor"] = str(contacts[-1].id)
+        await response_cache.set(user.id, key, response)
+    return response
 
 
 @router.get(
@@ -49,6 +148,7 @@ async def get_contacts(
     dependencies=[Depends(RateLimiter(times=10, seconds=60))],
 )
 async def get_contact(
+    request: Request,
     contact_id: int = Path(ge=1),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(auth_service.get_current_user),
@@ -56,7 +156,11 @@ async def get_contact(
     """
     Get a contact by its ID.
 
+    The response carries an ``ETag`` built from the contact's modification
+    time; a matching ``If-None-Match`` gets a 304.
+
     Args:
+        request (Request): The HTTP request object.
         contact_id (int): The ID of the contact.
         db (AsyncSession): The asynchronous database session.
         user (User): The authenticated user.
@@ -73,7 +177,13 @@ async def get_contact(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="NOT FOUND",
         )
-    return contact
+    etag = f'W/"{contact_id}-{contact.updated_at.timestamp()}"'
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    response = _render(contact)
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.post(
@@ -102,13 +212,13 @@ async def create_contact(
     Raises:
         HTTPException: If a contact with the same number or email already exists.
     """
-    existing_contact = await repository_contacts.get_existing_contact(body, user, db)
-    if existing_contact:
+    contact = await repository_contacts.create_contact(body, user, db)
+    if contact is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Contact with this number or email already exists",
         )
-    contact = await repository_contacts.create_contact(body, user, db)
+    await response_cache.clear(user.id)
     return contact
 
 
@@ -145,6 +255,7 @@ async def update_contact(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="NOT FOUND",
         )
+    await response_cache.clear(user.id)
     return contact
 
 
@@ -179,12 +290,13 @@ async def delete_contact(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="NOT FOUND",
         )
+    await response_cache.clear(user.id)
     return contact
 
 
 @router.get(
     "/search/{contact_value}",
-    response_model=List[ContactResponseSchema],
+    response_model=List[ContactShortResponseSchema],
     description="No more than 10 requests per minute",
     dependencies=[Depends(RateLimiter(times=10, seconds=60))],
 )
@@ -202,31 +314,53 @@ async def get_contacts_by_field(
         user (User, optional): The current user.
 
     Returns:
-        List[ContactResponseSchema]: List of contacts matching the search criteria.
+        List[ContactShortResponseSchema]: List of contacts matching the search criteria.
     """
     contacts = await repository_contacts.get_by_field(contact_value, user, db)
-    return contacts
+    return _render_list(contacts)
 
 
 @router.get(
     "/birthday/next-week",
-    response_model=List[ContactResponseSchema],
+    response_model=List[ContactShortResponseSchema],
     description="No more than 10 requests per minute",
     dependencies=[Depends(RateLimiter(times=10, seconds=60))],
 )
 async def get_birthday_next_week(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(auth_service.get_current_user),
 ):
     """
     Retrieve contacts with birthdays in the next week.
 
+    The response carries an ``ETag`` built from today's date, the latest
+    modification time and the number of contacts; a matching
+    ``If-None-Match`` gets a 304. Responses are cached per user for a short
+    time; a cached response is only served if it was built for the current
+    ETag.
+
     Args:
+        request (Request): The HTTP request object.
         db (AsyncSession, optional): The database session.
         user (User, optional): The current user.
 
     Returns:
-        List[ContactResponseSchema]: List of contacts with birthdays in the next week.
+        List[ContactShortResponseSchema]: List of contacts with birthdays in the next week.
     """
-    contacts = await repository_contacts.birthday_week_contacts(user, db)
-    return contacts
+    key = response_cache.key(user.id, request)
+    (updated_at, total), response = await asyncio.gather(
+        repository_contacts.get_contacts_state(user, db),
+        response_cache.get(key),
+    )
+    version = updated_at.timestamp() if updated_at else 0
+    etag = f'W/"{date.today()}-{version}-{total}"'
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    if response is None or response.headers.get("ETag") != etag:
+        contacts = await repository_contacts.birthday_week_contacts(user, db)
+        response = _render_list(contacts)
+        response.headers["ETag"] = etag
+        await response_cache.set(user.id, key, response)
+    return response
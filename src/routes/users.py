@@ -113,7 +113,7 @@ async def reset_password(
             status_code=status.HTTP_404_NOT_FOUND, detail=messages.USER_NOT_FOUND
         )
 
-    hashed_password = auth_service.get_password_hash(body.new_password)
+    hashed_password = await auth_service.get_password_hash(body.new_password)
     await repository_users.update_user_password(user, hashed_password, db)
 
     return {"message": messages.PASSWORD_RESET_SUCCESS}
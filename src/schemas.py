@@ -31,12 +31,15 @@ class ContactSchema(BaseModel):
     additional_data: str | None = Field(max_length=300)
 
 
-class ContactResponseSchema(ContactSchema):
+class ContactShortResponseSchema(ContactSchema):
     id: int = 1
-    user: UserResponseSchema | None
     model_config = ConfigDict(from_attributes=True)
 
 
+class ContactResponseSchema(ContactShortResponseSchema):
+    user: UserResponseSchema | None
+
+
 class RequestEmail(BaseModel):
     email: EmailStr
 
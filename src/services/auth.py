@@ -1,7 +1,10 @@
+import asyncio
+import os
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-import redis
+import redis.asyncio as redis
 from jose import JWTError, jwt  # noqa
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
@@ -23,14 +26,22 @@ class Auth:
     ALGORITHM = config.algorithm
     oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
     cache = redis.Redis(host=config.redis_host, port=config.redis_port, db=0)
+    # bcrypt is CPU-bound; run it off the event loop on a bounded pool.
+    cpu_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+    async def verify_password(self, plain_password, hashed_password):
+        """Verify a plain password against its hash."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.cpu_pool, self.pwd_context.verify, plain_password, hashed_password
+        )
 
-    def verify_password(self, plain_password, hashed_password):
-        """Class to handle authentication-related operations."""
-        return self.pwd_context.verify(plain_password, hashed_password)
-
-    def get_password_hash(self, password: str):
+    async def get_password_hash(self, password: str):
         """Generate a hashed password from a plain password."""
-        return self.pwd_context.hash(password)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.cpu_pool, self.pwd_context.hash, password
+        )
 
     async def create_access_token(
         self, data: dict, expires_delta: Optional[float] = None
@@ -179,13 +190,12 @@ class Auth:
         except JWTError as e:
             raise credentials_exception
 
-        user = self.cache.get(f"user:{email}")
+        user = await self.cache.get(f"user:{email}")
         if user is None:
             user = await repository_users.get_user_by_email(email, db)
             if user is None:
                 raise credentials_exception
-            self.cache.set(f"user:{email}", pickle.dumps(user))  # noqa
-            self.cache.expire(f"user:{email}", 900)  # noqa
+            await self.cache.set(f"user:{email}", pickle.dumps(user), ex=900)
         else:
             user = pickle.loads(user)
         return user
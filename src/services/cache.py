@@ -0,0 +1,90 @@
+import redis.asyncio as redis
+from fastapi import Request, Response
+
+from src.conf.config import config
+
+
+class ResponseCache:
+    """
+    Class to cache rendered contact responses in Redis, per user.
+
+    The keys of a user's cached responses are tracked in a Redis set, so
+    they can be dropped without scanning the whole keyspace.
+    """
+
+    prefix = "contacts"
+    expire = 30
+    redis = redis.Redis(host=config.redis_host, port=config.redis_port, db=0)
+
+    def key(self, user_id: int, request: Request) -> str:
+        """
+        Build the cache key of a request made by a user.
+
+        Args:
+            user_id (int): ID of the user making the request.
+            request (Request): The HTTP request object.
+
+        Returns:
+            str: Cache key.
+        """
+        return f"{self.prefix}:{user_id}:{request.url.path}?{request.url.query}"
+
+    def index(self, user_id: int) -> str:
+        """
+        Build the key of the set holding a user's cache keys.
+
+        Args:
+            user_id (int): ID of the user.
+
+        Returns:
+            str: Key of the set.
+        """
+        return f"{self.prefix}:{user_id}"
+
+    async def get(self, key: str) -> Response | None:
+        """
+        Get a cached response.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Response | None: The cached response or None if it is not cached.
+        """
+        cached = await self.redis.hgetall(key)
+        if not cached:
+            return None
+        body = cached.pop(b"body")
+        headers = {name.decode(): value.decode() for name, value in cached.items()}
+        return Response(content=body, headers=headers)
+
+    async def set(self, user_id: int, key: str, response: Response) -> None:
+        """
+        Cache a response for ``expire`` seconds.
+
+        Args:
+            user_id (int): ID of the user the response belongs to.
+            key (str): Cache key.
+            response (Response): The rendered response to cache.
+        """
+        index = self.index(user_id)
+        async with self.redis.pipeline() as pipe:
+            pipe.hset(key, mapping={"body": response.body, **response.headers})
+            pipe.expire(key, self.expire)
+            pipe.sadd(index, key)
+            pipe.expire(index, self.expire)
+            await pipe.execute()
+
+    async def clear(self, user_id: int) -> None:
+        """
+        Drop every cached response of a user.
+
+        Args:
+            user_id (int): ID of the user whose responses to drop.
+        """
+        index = self.index(user_id)
+        keys = await self.redis.smembers(index)
+        await self.redis.delete(index, *keys)
+
+
+response_cache = ResponseCache()
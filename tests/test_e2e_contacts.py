@@ -0,0 +1,227 @@
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import Request, Response
+from fastapi_limiter.depends import RateLimiter
+
+from main import app
+from src.database.models import User, Contact
+from src.services.auth import auth_service
+from src.services.cache import response_cache
+from tests.conftest import TestingSessionLocal
+
+user = User(
+    id=1,
+    username="volodimir",
+    email="volodia@gmail.com",
+    password="uawin123",
+    avatar="avatar",
+    confirmed=True,
+    created_at=date.today(),
+    updated_at=date.today(),
+)
+
+
+def add_contacts(first, last):
+    async def add():
+        async with TestingSessionLocal() as session:
+            session.add_all(
+                Contact(
+                    name=f"Name{i}",
+                    surname="Surname",
+                    email=f"contact{i}@gmail.com",
+                    number=str(i),
+                    bd_date=date(year=1990, month=1, day=i),
+                    additional_data="data",
+                    user_id=user.id,
+                )
+                for i in range(first, last + 1)
+            )
+            await session.commit()
+
+    asyncio.run(add())
+
+
+@pytest.fixture(scope="module", autouse=True)
+def contacts(client):
+    async def add_user():
+        async with TestingSessionLocal() as session:
+            session.add(user)
+            await session.commit()
+
+    asyncio.run(add_user())
+    add_contacts(1, 3)
+    app.dependency_overrides[auth_service.get_current_user] = lambda: user
+    yield
+    del app.dependency_overrides[auth_service.get_current_user]
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    async def call(self, request: Request, response: Response):
+        return None
+
+    monkeypatch.setattr(RateLimiter, "__call__", call)
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    monkeypatch.setattr(response_cache, "get", AsyncMock(return_value=None))
+    monkeypatch.setattr(response_cache, "set", AsyncMock())
+    monkeypatch.setattr(response_cache, "clear", AsyncMock())
+    return response_cache
+
+
+def test_get_contacts_etag(client, cache):
+    response = client.get("/api/contacts/")
+    assert response.status_code == 200, response.text
+    assert [contact["id"] for contact in response.json()] == [1, 2, 3]
+    assert response.headers["ETag"].startswith('W/"')
+    assert response.headers["X-Total-Count"] == "3"
+    cached = cache.set.await_args.args[2]
+    assert cached.headers["ETag"] == response.headers["ETag"]
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ["{etag}", "*", 'W/"stale", {etag}'],
+)
+def test_get_contacts_not_modified(client, if_none_match):
+    etag = client.get("/api/contacts/").headers["ETag"]
+    response = client.get(
+        "/api/contacts/",
+        headers={"If-None-Match": if_none_match.format(etag=etag)},
+    )
+    assert response.status_code == 304, response.text
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_get_contacts_modified(client):
+    response = client.get("/api/contacts/", headers={"If-None-Match": 'W/"stale"'})
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == 3
+
+
+def test_get_contacts_cached(client, cache):
+    etag = client.get("/api/contacts/").headers["ETag"]
+    cache.get.return_value = Response(content=b"[]", headers={"ETag": etag})
+    cache.set.reset_mock()
+    response = client.get("/api/contacts/")
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+    cache.set.assert_not_awaited()
+
+
+def test_get_contacts_cached_other_version(client, cache):
+    cache.get.return_value = Response(content=b"[]", headers={"ETag": 'W/"stale"'})
+    response = client.get("/api/contacts/")
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == 3
+    assert response.headers["ETag"] != 'W/"stale"'
+    cache.set.assert_awaited_once()
+
+
+def test_get_contact_etag(client):
+    response = client.get("/api/contacts/1")
+    assert response.status_code == 200, response.text
+    assert response.json()["name"] == "Name1"
+    assert response.json()["user"]["email"] == user.email
+    assert response.headers["ETag"].startswith('W/"1-')
+
+
+def test_get_contact_not_modified(client):
+    etag = client.get("/api/contacts/1").headers["ETag"]
+    response = client.get("/api/contacts/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304, response.text
+    assert response.headers["ETag"] == etag
+
+
+def test_get_contact_other_etag(client):
+    etag = client.get("/api/contacts/2").headers["ETag"]
+    response = client.get("/api/contacts/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] != etag
+
+
+def test_get_contact_not_found(client):
+    response = client.get("/api/contacts/100", headers={"If-None-Match": "*"})
+    assert response.status_code == 404, response.text
+
+
+@pytest.mark.parametrize(
+    "email, number",
+    [("contact1@gmail.com", "100"), ("new@gmail.com", "1")],
+)
+def test_create_contact_taken(client, email, number):
+    response = client.post(
+        "/api/contacts/",
+        json={
+            "name": "Name",
+            "surname": "Surname",
+            "email": email,
+            "number": number,
+            "bd_date": "1990-01-01",
+            "additional_data": "data",
+        },
+    )
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == (
+        "Contact with this number or email already exists"
+    )
+
+
+def test_get_contacts_next_cursor(client):
+    add_contacts(4, 12)
+    response = client.get("/api/contacts/", params={"limit": 10})
+    assert response.status_code == 200, response.text
+    assert [contact["id"] for contact in response.json()] == list(range(1, 11))
+    assert response.headers["X-Total-Count"] == "12"
+    cursor = response.headers["X-Next-Cursor"]
+    assert cursor == "10"
+
+    response = client.get("/api/contacts/", params={"limit": 10, "after_id": cursor})
+    assert response.status_code == 200, response.text
+    assert [contact["id"] for contact in response.json()] == [11, 12]
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_cors_exposes_headers(client):
+    response = client.get("/api/contacts/", headers={"Origin": "http://example.com"})
+    assert response.status_code == 200, response.text
+    exposed = response.headers["Access-Control-Expose-Headers"]
+    assert {name.strip() for name in exposed.split(",")} == {
+        "X-Next-Cursor",
+        "X-Total-Count",
+        "ETag",
+    }
+
+
+def test_get_birthday_cached_other_version(client, cache):
+    cache.get.return_value = Response(content=b"[]", headers={"ETag": 'W/"stale"'})
+    response = client.get("/api/contacts/birthday/next-week")
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] != 'W/"stale"'
+    cached = cache.set.await_args.args[2]
+    assert cached.headers["ETag"] == response.headers["ETag"]
+
+
+def test_get_birthday_cached(client, cache):
+    etag = client.get("/api/contacts/birthday/next-week").headers["ETag"]
+    cache.get.return_value = Response(content=b"[]", headers={"ETag": etag})
+    cache.set.reset_mock()
+    response = client.get("/api/contacts/birthday/next-week")
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+    cache.set.assert_not_awaited()
+
+
+def test_get_birthday_not_modified(client):
+    etag = client.get("/api/contacts/birthday/next-week").headers["ETag"]
+    response = client.get(
+        "/api/contacts/birthday/next-week", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304, response.text
+    assert response.headers["ETag"] == etag
@@ -1,102 +1,182 @@
-import unittest
-from datetime import date
-from unittest.mock import AsyncMock, MagicMock, Mock
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
 
-from sqlalchemy import select
+import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User, Contact
-from src.schemas import ContactSchema, ContactResponseSchema
+from src.schemas import ContactSchema
 from src.repository.contacts import (
     get_contacts,
+    get_contacts_state,
     get_contact,
-    get_existing_contact,
     create_contact,
     update_contact,
     remove_contact,
-    get_by_field,
     birthday_week_contacts,
 )
 
 
-class TestAsync(unittest.IsolatedAsyncioTestCase):
-    def setUp(self):
-        self.session = AsyncMock(spec=AsyncSession)
-        self.user = User(id=1, email="test@test.com", password="asdasd", confirmed=True)
-        self.body = ContactSchema(
-            name="asdasd",
-            surname="zxczxc",
-            email="zxczxc",
-            number="123123123",
-            bd_date=date(year=2011, month=1, day=1),
-            additional_data="zxzxcc",
-        )
-        self.contact = Contact(
-            id=1,
-            name="Test1",
-            surname="Test1",
-            email="Test1@gmail",
-            number="123123123",
-            bd_date=date(year=2011, month=1, day=1),
-            additional_data="zxzxcc",
-            user_id=self.user.id,
-        )
-
-    async def test_get_contacts(self):
-        limit = 10
-        offset = 0
-        expected_contacts = [Contact(), Contact(), Contact(), Contact()]
-        mock_contacts = MagicMock()
-        mock_contacts.scalars.return_value.all.return_value = expected_contacts
-        self.session.execute.return_value = mock_contacts
-        result = await get_contacts(limit, offset, self.user, self.session)
-        self.assertEqual(result, expected_contacts)
-
-    async def test_get_contact(self):
-        expected_contact = Contact()
-        mock_contact = MagicMock()
-        mock_contact.scalar_one_or_none.return_value = expected_contact
-        self.session.execute.return_value = mock_contact
-        result = await get_contact(self.user.id, self.user, self.session)
-        self.assertEqual(result, expected_contact)
-
-    async def test_get_existing_contact(self):
-        expected_contact = Contact()
-        mock_contact = MagicMock()
-        mock_contact.scalar_one_or_none.return_value = expected_contact
-        self.session.execute.return_value = mock_contact
-        result = await get_existing_contact(self.body, self.user, self.session)
-        self.assertEqual(result, expected_contact)
-
-    async def test_create_contact(self):
-        result = await create_contact(self.body, self.user, self.session)
-        self.assertEqual(result.name, self.body.name)
-        self.assertEqual(result.surname, self.body.surname)
-        self.assertEqual(result.number, self.body.number)
-        self.assertEqual(result.bd_date, self.body.bd_date)
-        self.assertEqual(result.additional_data, self.body.additional_data)
-
-    async def test_update_contact(self):
-        mock_contact = MagicMock()
-        mock_contact.scalar_one_or_none.return_value = self.contact
-        self.session.execute.return_value = mock_contact
-
-        result = await update_contact(
-            self.contact.id, self.body, self.user, self.session
-        )
-
-        self.assertEqual(result.name, self.body.name)
-        self.assertEqual(result.surname, self.body.surname)
-        self.assertEqual(result.number, self.body.number)
-        self.assertEqual(result.bd_date, self.body.bd_date)
-        self.assertEqual(result.additional_data, self.body.additional_data)
-
-    async def test_remove_contact(self):
-        mock_contact = MagicMock()
-        mock_contact.scalar_one_or_none.return_value = self.contact
-        self.session.execute.return_value = mock_contact
-
-        result = await remove_contact(self.contact.id, self.user, self.session)
-
-        assert result is not None
-        assert result.id == self.contact.id
\ No newline at end of file
+@pytest.fixture(scope="module")
+def session():
+    # Building a spec'd mock walks the whole AsyncSession class; do it once.
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture(autouse=True)
+def reset_session(session):
+    yield
+    session.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def user():
+    return User(id=1, email="test@test.com", password="asdasd", confirmed=True)
+
+
+@pytest.fixture
+def body():
+    return ContactSchema(
+        name="asdasd",
+        surname="zxczxc",
+        email="zxczxc",
+        number="123123123",
+        bd_date=date(year=2011, month=1, day=1),
+        additional_data="zxzxcc",
+    )
+
+
+@pytest.fixture
+def contact(user):
+    return Contact(
+        id=1,
+        name="Test1",
+        surname="Test1",
+        email="Test1@gmail",
+        number="123123123",
+        bd_date=date(year=2011, month=1, day=1),
+        additional_data="zxzxcc",
+        user_id=user.id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_contacts(session, user):
+    limit = 10
+    after_id = None
+    expected_contacts = [Contact(), Contact(), Contact(), Contact()]
+    mock_contacts = MagicMock()
+    mock_contacts.mappings.return_value.all.return_value = expected_contacts
+    session.execute.return_value = mock_contacts
+    result = await get_contacts(limit, after_id, user, session)
+    assert result == expected_contacts
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_state(session, user):
+    updated_at = datetime(year=2023, month=8, day=15)
+    mock_state = MagicMock()
+    mock_state.one.return_value = (updated_at, 4)
+    session.execute.return_value = mock_state
+    result = await get_contacts_state(user, session)
+    assert result == (updated_at, 4)
+
+
+@pytest.mark.asyncio
+async def test_get_contact(session, user):
+    expected_contact = Contact()
+    mock_contact = MagicMock()
+    mock_contact.scalar_one_or_none.return_value = expected_contact
+    session.execute.return_value = mock_contact
+    result = await get_contact(user.id, user, session)
+    assert result == expected_contact
+
+
+@pytest.mark.asyncio
+async def test_create_contact(session, user, body):
+    mock_contact = MagicMock()
+    mock_contact.scalar_one_or_none.return_value = Contact(
+        id=1, **body.model_dump(), user_id=user.id
+    )
+    session.execute.return_value = mock_contact
+    result = await create_contact(body, user, session)
+    assert result.name == body.name
+    assert result.surname == body.surname
+    assert result.number == body.number
+    assert result.bd_date == body.bd_date
+    assert result.additional_data == body.additional_data
+    assert result.user == user
+
+
+@pytest.mark.asyncio
+async def test_create_existing_contact(session, user, body):
+    mock_contact = MagicMock()
+    mock_contact.scalar_one_or_none.return_value = None
+    session.execute.return_value = mock_contact
+    result = await create_contact(body, user, session)
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_update_contact(session, user, body, contact):
+    mock_contact = MagicMock()
+    mock_contact.scalar_one_or_none.return_value = Contact(
+        id=contact.id, **body.model_dump(), user_id=user.id
+    )
+    session.execute.return_value = mock_contact
+
+    result = await update_contact(contact.id, body, user, session)
+
+    assert result.name == body.name
+    assert result.surname == body.surname
+    assert result.number == body.number
+    assert result.bd_date == body.bd_date
+    assert result.additional_data == body.additional_data
+
+
+@pytest.mark.asyncio
+async def test_update_missing_contact(session, user, body, contact):
+    mock_contact = MagicMock()
+    mock_contact.scalar_one_or_none.return_value = None
+    session.execute.return_value = mock_contact
+
+    result = await update_contact(contact.id, body, user, session)
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_remove_contact(session, user, contact):
+    mock_contact = MagicMock()
+    mock_contact.scalar_one_or_none.return_value = contact
+    session.execute.return_value = mock_contact
+
+    result = await remove_contact(contact.id, user, session)
+
+    assert result is not None
+    assert result.id == contact.id
+
+
+@pytest.mark.asyncio
+async def test_birthday_week_contacts(session, user):
+    expected_contacts = [Contact(), Contact()]
+    mock_contacts = MagicMock()
+    mock_contacts.mappings.return_value.all.return_value = expected_contacts
+    session.execute.return_value = mock_contacts
+    result = await birthday_week_contacts(user, session)
+    assert result == expected_contacts
+
+
+@pytest.mark.asyncio
+async def test_birthday_week_contacts_wraps_year(session, user, monkeypatch):
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return cls(year=2023, month=12, day=28)
+
+    monkeypatch.setattr("src.repository.contacts.date", FrozenDate)
+    session.execute.return_value = MagicMock()
+    await birthday_week_contacts(user, session)
+    sq = session.execute.call_args.args[0]
+    keys = [value for value in sq.compile().params.values() if isinstance(value, list)]
+    assert keys == [[(12, 28), (12, 29), (12, 30), (12, 31), (1, 1), (1, 2), (1, 3)]]
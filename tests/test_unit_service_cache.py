@@ -0,0 +1,77 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import Request, Response
+
+from src.services.cache import ResponseCache
+
+
+@pytest.fixture
+def redis():
+    redis = MagicMock()
+    redis.hgetall = AsyncMock()
+    redis.smembers = AsyncMock()
+    redis.delete = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+    return redis
+
+
+@pytest.fixture
+def cache(redis):
+    cache = ResponseCache()
+    cache.redis = redis
+    return cache
+
+
+def test_key(cache):
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/contacts/",
+            "query_string": b"limit=10",
+            "headers": [],
+        }
+    )
+    assert cache.key(1, request) == "contacts:1:/api/contacts/?limit=10"
+
+
+@pytest.mark.asyncio
+async def test_get_missing(cache, redis):
+    redis.hgetall.return_value = {}
+    result = await cache.get("contacts:1:/api/contacts/?")
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_get(cache, redis):
+    redis.hgetall.return_value = {b"body": b"[]", b"etag": b'W/"0-0"'}
+    result = await cache.get("contacts:1:/api/contacts/?")
+    assert result.body == b"[]"
+    assert result.headers["etag"] == 'W/"0-0"'
+
+
+@pytest.mark.asyncio
+async def test_set(cache, redis):
+    key = "contacts:1:/api/contacts/?"
+    response = Response(content=b"[]", media_type="application/json")
+    await cache.set(1, key, response)
+    pipe = redis.pipeline.return_value.__aenter__.return_value
+    pipe.hset.assert_called_once_with(
+        key, mapping={"body": b"[]", **response.headers}
+    )
+    pipe.sadd.assert_called_once_with("contacts:1", key)
+    pipe.expire.assert_any_call(key, cache.expire)
+    pipe.expire.assert_any_call("contacts:1", cache.expire)
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_clear(cache, redis):
+    keys = {b"contacts:1:/api/contacts/?", b"contacts:1:/api/contacts/1?"}
+    redis.smembers.return_value = keys
+    await cache.clear(1)
+    redis.smembers.assert_awaited_once_with("contacts:1")
+    redis.delete.assert_awaited_once_with("contacts:1", *keys)